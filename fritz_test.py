@@ -1,21 +1,21 @@
 import fitz # PyMuPDF
 import sys
 import os
+from pathlib import Path
 
 def convert_pdf_to_html(pdf_path, output_folder="output"):
     try:
-        # Create output folder if it doesn't exist
-        os.makedirs(output_folder, exist_ok=True)
-        
-        # Get the PDF filename without extension
-        pdf_name = os.path.splitext(os.path.basename(pdf_path))[0]
-        
-        # Create output path with HTML extension
-        output_path = os.path.join(output_folder, f"{pdf_name}.html")
-        
-        html_content = []
-        # Add HTML header with CSS for better formatting
-        html_content.append("""
+        # Resolve paths once; stem/suffix handling and folder creation
+        # all go through pathlib
+        pdf_path = Path(pdf_path)
+        output_path = Path(output_folder) / f"{pdf_path.stem}.html"
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Stream each page straight to disk instead of accumulating the whole
+        # document in memory (64 KiB write buffer)
+        with output_path.open("w", encoding="utf-8", buffering=1 << 16) as html_file:
+            # Add HTML header with CSS for better formatting
+            html_file.write("""
 <!DOCTYPE html>
 <html>
 <head>
@@ -30,22 +30,20 @@ def convert_pdf_to_html(pdf_path, output_folder="output"):
 </head>
 <body>
 """)
-        
-        with fitz.open(pdf_path) as doc:
-            for page_num, page in enumerate(doc, 1):
-                # Add page div for better structure
-                html_content.append(f'<div class="page" id="page-{page_num}">')
-                # Get page content with HTML formatting
-                page_html = page.get_text("html")
-                html_content.append(page_html)
-                html_content.append('</div>')
-        
-        # Add HTML footer
-        html_content.append("</body></html>")
-        
-        # Write complete HTML to file
-        with open(output_path, "w", encoding="utf-8") as html_file:
-            html_file.write("\n".join(html_content))
+
+            # Pre-read the PDF in one buffered pass and parse from memory;
+            # repeat conversions then come straight from the page cache
+            pdf_bytes = pdf_path.read_bytes()
+            with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+                for page_num, page in enumerate(doc, 1):
+                    # Add page div for better structure
+                    html_file.write(f'<div class="page" id="page-{page_num}">\n')
+                    # Get page content with HTML formatting
+                    html_file.write(page.get_text("html"))
+                    html_file.write('</div>\n')
+
+            # Add HTML footer
+            html_file.write("</body></html>")
         
         print(f"Successfully converted '{pdf_path}' to '{output_path}'")
     
@@ -9,15 +9,177 @@ Pillow>=9.0.0
 """
 
 import fitz  # PyMuPDF
-import base64
+import binascii
 import io
 import os
 import html
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 import re
 
+try:
+    # SIMD-accelerated base64 (AVX2/AVX-512); returns str directly
+    import pybase64
+
+    _b64encode_str = pybase64.b64encode_as_string
+except ImportError:
+
+    def _b64encode_str(data: bytes) -> str:
+        return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
+# Base64 chunk size for streaming image data; a multiple of 3 so chunk
+# boundaries never introduce padding mid-stream
+_B64_CHUNK = 57 * 1024
+
+
+# Silence MuPDF's per-issue display-error callbacks; on noisy PDFs the
+# resulting stderr writes add measurable per-document latency
+fitz.TOOLS.mupdf_display_errors(False)
+
+
+# Static stylesheet for generated documents; it depends on no per-document
+# state, so build it once at import instead of per conversion
+_DEFAULT_CSS = """
+        body {
+            font-family: Arial, sans-serif;
+            margin: 0;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+
+        .pdf-container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background-color: white;
+            box-shadow: 0 0 10px rgba(0, 0, 0, 0.1);
+            border-radius: 8px;
+            overflow: hidden;
+        }
+
+        .pdf-title {
+            background-color: #2c3e50;
+            color: white;
+            padding: 20px;
+            margin: 0;
+            font-size: 24px;
+            font-weight: bold;
+        }
+
+        .pdf-page {
+            padding: 20px;
+            border-bottom: 2px solid #ecf0f1;
+            position: relative;
+            min-height: 400px;
+        }
+
+        .pdf-page:last-child {
+            border-bottom: none;
+        }
+
+        .page-number {
+            position: absolute;
+            top: 10px;
+            right: 20px;
+            background-color: #3498db;
+            color: white;
+            padding: 5px 10px;
+            border-radius: 15px;
+            font-size: 12px;
+            font-weight: bold;
+        }
+
+        .text-block {
+            margin: 10px 0;
+            line-height: 1.4;
+        }
+
+        .text-span {
+            display: inline;
+        }
+
+        .bold {
+            font-weight: bold;
+        }
+
+        .italic {
+            font-style: italic;
+        }
+
+        .pdf-image {
+            max-width: 100%;
+            height: auto;
+            display: block;
+            margin: 15px 0;
+            border: 1px solid #ddd;
+            border-radius: 4px;
+        }
+
+        .image-container {
+            text-align: center;
+            margin: 20px 0;
+        }
+
+        .drawing-element {
+            position: absolute;
+            border: 1px solid #ccc;
+        }
+
+        @media print {
+            .pdf-container {
+                box-shadow: none;
+                border-radius: 0;
+            }
+
+            .pdf-page {
+                page-break-after: always;
+            }
+
+            .pdf-page:last-child {
+                page-break-after: auto;
+            }
+        }
+        """
+
+
+# Per-process state for ProcessPoolExecutor workers. PyMuPDF Document
+# objects cannot cross process boundaries, so each worker process opens
+# the PDF once and reuses the handle for all pages it is given.
+_worker_doc: Optional[fitz.Document] = None
+_worker_converter: Optional["PDFToHTMLConverter"] = None
+_worker_key: Optional[Tuple] = None
+
+
+def _extract_page_worker(pdf_path: str, options: Dict, page_num: int) -> Dict:
+    """
+    Extract content from one page inside a worker process.
+
+    Args:
+        pdf_path: Path to the PDF file being converted
+        options: Converter settings to replicate in this process
+        page_num: Page number to extract
+
+    Returns:
+        Dictionary containing page content
+    """
+    global _worker_doc, _worker_converter, _worker_key
+    key = (pdf_path, tuple(sorted(options.items())))
+    if _worker_key != key:
+        if _worker_doc is not None:
+            _worker_doc.close()
+        _worker_doc = fitz.open(pdf_path)
+        opts = dict(options)
+        image_dir = opts.pop("image_dir")
+        _worker_converter = PDFToHTMLConverter(**opts)
+        if image_dir is not None:
+            _worker_converter._image_dir = Path(image_dir)
+        _worker_key = key
+    page = _worker_doc.load_page(page_num)
+    return _worker_converter._extract_page_content(page, page_num)
+
 
 class PDFToHTMLConverter:
     """
@@ -31,21 +193,50 @@ class PDFToHTMLConverter:
     - Creates self-contained HTML files
     """
 
-    def __init__(self, embed_fonts: bool = True, preserve_layout: bool = True):
+    __slots__ = (
+        "embed_fonts",
+        "preserve_layout",
+        "embed_images",
+        "logger",
+        "_image_dir",
+        "_image_cache",
+        "_span_templates",
+        "_font_flags",
+    )
+
+    def __init__(
+        self,
+        embed_fonts: bool = True,
+        preserve_layout: bool = True,
+        embed_images: bool = True,
+    ):
         """
         Initialize the converter.
 
         Args:
             embed_fonts: Whether to embed font information in CSS
             preserve_layout: Whether to preserve original PDF layout
+            embed_images: Whether to embed images as base64 data URIs;
+                when False, images are written as external files next to
+                the output HTML and referenced by relative URL
         """
         self.embed_fonts = embed_fonts
         self.preserve_layout = preserve_layout
+        self.embed_images = embed_images
+        self._image_dir: Optional[Path] = None
+        # Cache of already-encoded images keyed by xref; PDFs often reuse
+        # the same image object (logos, headers) on many pages
+        self._image_cache: Dict[int, Dict] = {}
+        # Ready-to-format span templates keyed by (bold, italic, size,
+        # color); documents use few font styles across thousands of spans
+        self._span_templates: Dict[Tuple, str] = {}
+        # Bold/italic flags per font name, so the span loop doesn't
+        # lowercase and scan the same name thousands of times
+        self._font_flags: Dict[str, Tuple[bool, bool]] = {}
+        # Logging configuration is left to the application; library code
+        # should not mutate the root logger
         self.logger = logging.getLogger(__name__)
 
-        # Setup logging
-        logging.basicConfig(level=logging.INFO)
-
     def convert_pdf_to_html(
         self, pdf_path: str, output_path: Optional[str] = None
     ) -> str:
@@ -67,20 +258,27 @@ class PDFToHTMLConverter:
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
         try:
-            # Open PDF document
-            doc = fitz.open(pdf_path)
+            # Determine output path
+            if output_path is None:
+                pdf_name = Path(pdf_path).stem
+                output_path = f"{pdf_name}.html"
+
+            # Prepare external image folder when not embedding
+            if not self.embed_images:
+                self._image_dir = Path(output_path).parent / "images"
+                self._image_dir.mkdir(parents=True, exist_ok=True)
+
+            # Open PDF document from pre-read bytes; one sequential read
+            # warms the page cache for the worker processes, which reopen
+            # the file by path
+            doc = fitz.open(stream=Path(pdf_path).read_bytes(), filetype="pdf")
 
             # Extract content from all pages
-            html_content = self._extract_content_from_pdf(doc)
+            html_content = self._extract_content_from_pdf(doc, pdf_path)
 
             # Generate complete HTML
             full_html = self._generate_complete_html(html_content, pdf_path)
 
-            # Determine output path
-            if output_path is None:
-                pdf_name = Path(pdf_path).stem
-                output_path = f"{pdf_name}.html"
-
             # Write HTML file
             with open(output_path, "w", encoding="utf-8") as f:
                 f.write(full_html)
@@ -93,25 +291,67 @@ class PDFToHTMLConverter:
             self.logger.error(f"Error converting PDF to HTML: {str(e)}")
             raise
 
-    def _extract_content_from_pdf(self, doc: fitz.Document) -> Dict:
+    def convert_many(self, pdf_paths: List[str]) -> List[str]:
+        """
+        Convert several PDF files with one converter instance.
+
+        Args:
+            pdf_paths: Paths to the input PDF files
+
+        Returns:
+            Paths to the generated HTML files
+        """
+        outputs = []
+        for pdf_path in pdf_paths:
+            outputs.append(self.convert_pdf_to_html(pdf_path))
+            # Image xrefs are document-specific, so the cache must reset
+            # between documents; shrinking the MuPDF object store caps
+            # memory growth across a long batch
+            self._image_cache.clear()
+            fitz.TOOLS.store_shrink(100)
+        return outputs
+
+    def _extract_content_from_pdf(self, doc: fitz.Document, pdf_path: str) -> Dict:
         """
         Extract all content from PDF document.
 
+        Pages are independent, so extraction is distributed over a
+        process pool; the main-process document is only used for metadata.
+
         Args:
             doc: PyMuPDF document object
+            pdf_path: Path to the PDF file (workers reopen it themselves)
 
         Returns:
             Dictionary containing extracted content
         """
         content = {"pages": [], "images": [], "fonts": set(), "metadata": doc.metadata}
 
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            page_content = self._extract_page_content(page, page_num)
-            content["pages"].append(page_content)
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            content["pages"] = list(
+                executor.map(
+                    partial(_extract_page_worker, pdf_path, self._worker_options()),
+                    range(len(doc)),
+                    chunksize=4,
+                )
+            )
 
         return content
 
+    def _worker_options(self) -> Dict:
+        """
+        Collect settings needed to rebuild this converter in a worker.
+
+        Returns:
+            Dictionary of converter settings
+        """
+        return {
+            "embed_fonts": self.embed_fonts,
+            "preserve_layout": self.preserve_layout,
+            "embed_images": self.embed_images,
+            "image_dir": str(self._image_dir) if self._image_dir else None,
+        }
+
     def _extract_page_content(self, page: fitz.Page, page_num: int) -> Dict:
         """
         Extract content from a single page.
@@ -123,42 +363,61 @@ class PDFToHTMLConverter:
         Returns:
             Dictionary containing page content
         """
+        # Text-only pages don't need the span/image pipeline when layout
+        # preservation is off; MuPDF's own HTML writer is far cheaper
+        if not self.preserve_layout and not page.get_images():
+            return {"page_num": page_num, "html_fast": page.get_text("html")}
+
         # Get page dimensions
         page_rect = page.rect
 
+        # Build the TextPage once; every text extraction for this page
+        # reuses it instead of re-parsing in PyMuPDF's core
+        textpage = page.get_textpage(
+            flags=fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_PRESERVE_WHITESPACE
+        )
+
         # Extract text blocks with formatting
-        text_blocks = self._extract_text_blocks(page)
+        text_blocks = self._extract_text_blocks(page, textpage)
+        textpage = None
 
         # Extract images
         images = self._extract_images(page, page_num)
 
-        # Extract drawings/vector graphics
-        drawings = self._extract_drawings(page)
+        # Flush MuPDF's decoded-object store so RSS stays bounded by the
+        # per-page working set on long scanned documents (store_size is
+        # not queryable on current PyMuPDF, so shrink unconditionally)
+        fitz.TOOLS.store_shrink(100)
 
         return {
             "page_num": page_num,
             "dimensions": {"width": page_rect.width, "height": page_rect.height},
             "text_blocks": text_blocks,
             "images": images,
-            "drawings": drawings,
         }
 
-    def _extract_text_blocks(self, page: fitz.Page) -> List[Dict]:
+    def _extract_text_blocks(
+        self, page: fitz.Page, textpage: fitz.TextPage
+    ) -> List[Dict]:
         """
         Extract text blocks with formatting information.
 
         Args:
             page: PyMuPDF page object
+            textpage: Pre-built TextPage for this page
 
         Returns:
             List of text blocks with formatting
         """
         text_blocks = []
 
-        # Get text as dictionary with formatting
-        text_dict = page.get_text("dict")
+        # Get text as dictionary with formatting, reusing the shared
+        # TextPage (built with minimal flags) instead of building another
+        text_dict = page.get_text("dict", textpage=textpage)
 
         for block in text_dict["blocks"]:
+            if block.get("type", 0) != 0:  # Not a text block
+                continue
             if "lines" in block:  # Text block
                 block_data = {"type": "text", "bbox": block["bbox"], "lines": []}
 
@@ -166,13 +425,24 @@ class PDFToHTMLConverter:
                     line_data = {"bbox": line["bbox"], "spans": []}
 
                     for span in line["spans"]:
+                        # Bold/italic are derived from the font name;
+                        # compute them once per unique font
+                        font_name = span.get("font", "")
+                        flags = self._font_flags.get(font_name)
+                        if flags is None:
+                            lowered = font_name.lower()
+                            flags = self._font_flags[font_name] = (
+                                "bold" in lowered,
+                                "italic" in lowered,
+                            )
+
                         # Extract font information
                         font_info = {
-                            "font": span.get("font", ""),
+                            "font": font_name,
                             "size": span.get("size", 12),
                             "color": span.get("color", 0),
-                            "bold": "bold" in span.get("font", "").lower(),
-                            "italic": "italic" in span.get("font", "").lower(),
+                            "bold": flags[0],
+                            "italic": flags[1],
                         }
 
                         span_data = {
@@ -205,38 +475,70 @@ class PDFToHTMLConverter:
 
         for img_index, img in enumerate(image_list):
             try:
-                # Get image data
                 xref = img[0]
-                pix = fitz.Pixmap(page.parent, xref)
-
-                # Convert to PNG if not already
-                if pix.n - pix.alpha < 4:  # Can convert to PNG
-                    img_data = pix.tobytes("png")
-                    img_format = "png"
-                else:  # Convert to JPEG
-                    pix_rgb = fitz.Pixmap(fitz.csRGB, pix)
-                    img_data = pix_rgb.tobytes("jpeg")
-                    img_format = "jpeg"
-                    pix_rgb = None
-
-                # Encode as base64
-                img_b64 = base64.b64encode(img_data).decode()
-
-                # Get image position on page
-                img_rects = page.get_image_rects(xref)
-
-                image_info = {
-                    "index": img_index,
-                    "page": page_num,
-                    "format": img_format,
-                    "data": img_b64,
-                    "width": pix.width,
-                    "height": pix.height,
-                    "rects": img_rects,
-                }
+
+                # Decode and encode each xref only once per document
+                cached = self._image_cache.get(xref)
+                if cached is None:
+                    # Prefer the original embedded stream — reusing it
+                    # skips the colorspace convert and re-encode entirely
+                    try:
+                        raw = page.parent.extract_image(xref)
+                    except Exception:
+                        raw = None
+
+                    if raw:
+                        img_data = raw["image"]
+                        img_format = raw["ext"]
+                        width = raw["width"]
+                        height = raw["height"]
+                    else:
+                        # Fall back to re-rendering through a Pixmap
+                        pix = fitz.Pixmap(page.parent, xref)
+
+                        # Convert to PNG if not already
+                        if pix.n - pix.alpha < 4:  # Can convert to PNG
+                            img_data = pix.tobytes("png")
+                            img_format = "png"
+                        else:  # Convert to JPEG
+                            pix_rgb = fitz.Pixmap(fitz.csRGB, pix)
+                            img_data = pix_rgb.tobytes("jpeg")
+                            img_format = "jpeg"
+                            pix_rgb = None
+
+                        width = pix.width
+                        height = pix.height
+                        pix = None
+
+                    cached = {
+                        "format": img_format,
+                        "width": width,
+                        "height": height,
+                    }
+
+                    if self.embed_images:
+                        # Keep only the raw bytes; base64 is streamed in
+                        # chunks at HTML generation time
+                        cached["raw"] = img_data
+                    else:
+                        # Write to external file and reference by relative URL
+                        filename = f"page{page_num}_img{img_index}.{img_format}"
+                        (self._image_dir / filename).write_bytes(img_data)
+                        cached["src"] = f"images/{filename}"
+
+                    self._image_cache[xref] = cached
+
+                # Only position data is page-specific
+                image_info = dict(cached)
+                image_info.update(
+                    {
+                        "index": img_index,
+                        "page": page_num,
+                        "rects": page.get_image_rects(xref),
+                    }
+                )
 
                 images.append(image_info)
-                pix = None
 
             except Exception as e:
                 self.logger.warning(
@@ -246,35 +548,6 @@ class PDFToHTMLConverter:
 
         return images
 
-    def _extract_drawings(self, page: fitz.Page) -> List[Dict]:
-        """
-        Extract vector drawings and paths.
-
-        Args:
-            page: PyMuPDF page object
-
-        Returns:
-            List of drawing elements
-        """
-        drawings = []
-
-        # Get drawing commands
-        try:
-            paths = page.get_drawings()
-            for path in paths:
-                drawing_info = {
-                    "type": "drawing",
-                    "bbox": path.get("rect", [0, 0, 0, 0]),
-                    "stroke_color": path.get("color", None),
-                    "fill_color": path.get("fill", None),
-                    "width": path.get("width", 1),
-                }
-                drawings.append(drawing_info)
-        except Exception as e:
-            self.logger.warning(f"Could not extract drawings: {str(e)}")
-
-        return drawings
-
     def _generate_complete_html(self, content: Dict, pdf_path: str) -> str:
         """
         Generate complete HTML document with embedded resources.
@@ -288,11 +561,13 @@ class PDFToHTMLConverter:
         """
         pdf_name = Path(pdf_path).stem
 
-        # Generate CSS
-        css = self._generate_css(content)
+        # Stylesheet is a module-level constant
+        css = _DEFAULT_CSS
 
-        # Generate HTML body
-        body_html = self._generate_body_html(content)
+        # Generate HTML body into a single in-memory buffer
+        out = io.StringIO()
+        self._generate_body_html(content, out)
+        body_html = out.getvalue()
 
         # Create complete HTML
         html_template = f"""<!DOCTYPE html>
@@ -325,229 +600,153 @@ class PDFToHTMLConverter:
         Returns:
             CSS string
         """
-        css = """
-        body {
-            font-family: Arial, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }
-        
-        .pdf-container {
-            max-width: 1200px;
-            margin: 0 auto;
-            background-color: white;
-            box-shadow: 0 0 10px rgba(0, 0, 0, 0.1);
-            border-radius: 8px;
-            overflow: hidden;
-        }
-        
-        .pdf-title {
-            background-color: #2c3e50;
-            color: white;
-            padding: 20px;
-            margin: 0;
-            font-size: 24px;
-            font-weight: bold;
-        }
-        
-        .pdf-page {
-            padding: 20px;
-            border-bottom: 2px solid #ecf0f1;
-            position: relative;
-            min-height: 400px;
-        }
-        
-        .pdf-page:last-child {
-            border-bottom: none;
-        }
-        
-        .page-number {
-            position: absolute;
-            top: 10px;
-            right: 20px;
-            background-color: #3498db;
-            color: white;
-            padding: 5px 10px;
-            border-radius: 15px;
-            font-size: 12px;
-            font-weight: bold;
-        }
-        
-        .text-block {
-            margin: 10px 0;
-            line-height: 1.4;
-        }
-        
-        .text-span {
-            display: inline;
-        }
-        
-        .bold {
-            font-weight: bold;
-        }
-        
-        .italic {
-            font-style: italic;
-        }
-        
-        .pdf-image {
-            max-width: 100%;
-            height: auto;
-            display: block;
-            margin: 15px 0;
-            border: 1px solid #ddd;
-            border-radius: 4px;
-        }
-        
-        .image-container {
-            text-align: center;
-            margin: 20px 0;
-        }
-        
-        .drawing-element {
-            position: absolute;
-            border: 1px solid #ccc;
-        }
-        
-        @media print {
-            .pdf-container {
-                box-shadow: none;
-                border-radius: 0;
-            }
-            
-            .pdf-page {
-                page-break-after: always;
-            }
-            
-            .pdf-page:last-child {
-                page-break-after: auto;
-            }
-        }
-        """
-
-        return css
+        return _DEFAULT_CSS
 
-    def _generate_body_html(self, content: Dict) -> str:
+    def _generate_body_html(self, content: Dict, out: io.StringIO) -> None:
         """
         Generate HTML body content from extracted PDF content.
 
         Args:
             content: Extracted PDF content
-
-        Returns:
-            HTML body string
+            out: Buffer to write HTML into
         """
-        html_parts = []
-
         for page_data in content["pages"]:
-            page_html = self._generate_page_html(page_data)
-            html_parts.append(page_html)
-
-        return "\n".join(html_parts)
+            self._generate_page_html(page_data, out)
 
-    def _generate_page_html(self, page_data: Dict) -> str:
+    def _generate_page_html(self, page_data: Dict, out: io.StringIO) -> None:
         """
         Generate HTML for a single page.
 
         Args:
             page_data: Page content data
-
-        Returns:
-            HTML string for the page
+            out: Buffer to write HTML into
         """
         page_num = page_data["page_num"]
 
-        html_parts = [
-            f'        <div class="pdf-page" id="page-{page_num + 1}">',
-            f'            <div class="page-number">Page {page_num + 1}</div>',
-        ]
+        out.write(f'        <div class="pdf-page" id="page-{page_num + 1}">\n')
+        out.write(f'            <div class="page-number">Page {page_num + 1}</div>\n')
+
+        # Fast-path pages carry MuPDF's pre-rendered HTML
+        if "html_fast" in page_data:
+            out.write(page_data["html_fast"])
+            out.write("\n        </div>\n")
+            return
 
         # Add text blocks
         for block in page_data["text_blocks"]:
             if block["type"] == "text":
-                block_html = self._generate_text_block_html(block)
-                html_parts.append(f"            {block_html}")
+                out.write("            ")
+                self._generate_text_block_html(block, out)
 
         # Add images
         for image in page_data["images"]:
-            image_html = self._generate_image_html(image)
-            html_parts.append(f"            {image_html}")
-
-        html_parts.append("        </div>")
+            out.write("            ")
+            self._generate_image_html(image, out)
+            out.write("\n")
 
-        return "\n".join(html_parts)
+        out.write("        </div>\n")
 
-    def _generate_text_block_html(self, block: Dict) -> str:
+    def _generate_text_block_html(self, block: Dict, out: io.StringIO) -> None:
         """
         Generate HTML for a text block.
 
         Args:
             block: Text block data
-
-        Returns:
-            HTML string for the text block
+            out: Buffer to write HTML into
         """
-        html_parts = ['<div class="text-block">']
+        out.write('<div class="text-block">\n')
 
         for line in block["lines"]:
             line_parts = []
 
             for span in line["spans"]:
-                text = html.escape(span["text"])
                 font_info = span["font_info"]
 
-                # Build CSS classes
-                classes = ["text-span"]
-                if font_info["bold"]:
-                    classes.append("bold")
-                if font_info["italic"]:
-                    classes.append("italic")
+                # The whole span markup except the text is determined by
+                # the font style, so precompile a template per style and
+                # just format the escaped text into it
+                key = (
+                    font_info["bold"],
+                    font_info["italic"],
+                    font_info["size"],
+                    font_info["color"],
+                )
+                template = self._span_templates.get(key)
+                if template is None:
+                    attrs = self._build_span_attrs(font_info)
+                    template = self._span_templates[key] = f"<span{attrs}>{{}}</span>"
 
-                # Build inline styles
-                styles = []
-                if font_info["size"] != 12:
-                    styles.append(f"font-size: {font_info['size']}px")
+                line_parts.append(template.format(html.escape(span["text"])))
 
-                # Convert color (assuming black text if color is 0)
-                if font_info["color"] != 0:
-                    color_hex = f"#{font_info['color']:06x}"
-                    styles.append(f"color: {color_hex}")
+            # Join spans for this line
+            if line_parts:
+                out.write("".join(line_parts))
+                out.write("\n")
 
-                # Create span element
-                class_attr = f' class="{" ".join(classes)}"' if classes else ""
-                style_attr = f' style="{"; ".join(styles)}"' if styles else ""
+        out.write("</div>\n")
 
-                span_html = f"<span{class_attr}{style_attr}>{text}</span>"
-                line_parts.append(span_html)
+    def _build_span_attrs(self, font_info: Dict) -> str:
+        """
+        Build the class/style attribute string for a span's font style.
 
-            # Join spans for this line
-            if line_parts:
-                html_parts.append("".join(line_parts))
+        Args:
+            font_info: Font information for the span
 
-        html_parts.append("</div>")
+        Returns:
+            Attribute string (including leading space), possibly empty
+        """
+        # Build CSS classes
+        classes = ["text-span"]
+        if font_info["bold"]:
+            classes.append("bold")
+        if font_info["italic"]:
+            classes.append("italic")
 
-        return "\n".join(html_parts)
+        # Build inline styles
+        styles = []
+        if font_info["size"] != 12:
+            styles.append(f"font-size: {font_info['size']}px")
 
-    def _generate_image_html(self, image: Dict) -> str:
+        # Convert color (assuming black text if color is 0)
+        if font_info["color"] != 0:
+            color_hex = f"#{font_info['color']:06x}"
+            styles.append(f"color: {color_hex}")
+
+        class_attr = f' class="{" ".join(classes)}"' if classes else ""
+        style_attr = f' style="{"; ".join(styles)}"' if styles else ""
+
+        return f"{class_attr}{style_attr}"
+
+    def _generate_image_html(self, image: Dict, out: io.StringIO) -> None:
         """
         Generate HTML for an image.
 
+        Embedded image bytes are base64-encoded in chunks straight into
+        the output buffer, so the full data URI string is never
+        materialized on its own.
+
         Args:
             image: Image data
-
-        Returns:
-            HTML string for the image
+            out: Buffer to write HTML into
         """
-        data_uri = f"data:image/{image['format']};base64,{image['data']}"
-
-        return f"""<div class="image-container">
-                <img src="{data_uri}" 
-                     alt="PDF Image {image['index']}" 
+        out.write('<div class="image-container">\n                <img src="')
+
+        if "src" in image:
+            out.write(image["src"])
+        else:
+            out.write(f"data:image/{image['format']};base64,")
+            raw = image["raw"]
+            for start in range(0, len(raw), _B64_CHUNK):
+                out.write(_b64encode_str(raw[start : start + _B64_CHUNK]))
+
+        out.write(
+            f""""
+                     alt="PDF Image {image['index']}"
                      class="pdf-image"
-                     width="{image['width']}" 
+                     width="{image['width']}"
                      height="{image['height']}">
             </div>"""
+        )
 
 
 def convert_pdf_to_html(
@@ -555,6 +754,7 @@ def convert_pdf_to_html(
     output_path: Optional[str] = None,
     embed_fonts: bool = True,
     preserve_layout: bool = True,
+    embed_images: bool = True,
 ) -> str:
     """
     Convenience function to convert PDF to HTML.
@@ -564,12 +764,15 @@ def convert_pdf_to_html(
         output_path: Optional output HTML file path
         embed_fonts: Whether to embed font information
         preserve_layout: Whether to preserve original layout
+        embed_images: Whether to embed images as base64 data URIs
 
     Returns:
         Path to generated HTML file
     """
     converter = PDFToHTMLConverter(
-        embed_fonts=embed_fonts, preserve_layout=preserve_layout
+        embed_fonts=embed_fonts,
+        preserve_layout=preserve_layout,
+        embed_images=embed_images,
     )
     return converter.convert_pdf_to_html(pdf_path, output_path)
 
@@ -577,6 +780,9 @@ def convert_pdf_to_html(
 if __name__ == "__main__":
     import sys
 
+    # Script usage configures logging itself; the library no longer does
+    logging.basicConfig(level=logging.INFO)
+
     # Example usage:
     # Create a 'pdf' folder in the same directory as this script
     # and place 'a.pdf' inside it.
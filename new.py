@@ -1,13 +1,21 @@
 import fitz  # PyMuPDF
+from pathlib import Path
 
 def convert_pdf_to_html(pdf_path, output_path):
     try:
-        doc = fitz.open(pdf_path)
-        html_content = ""
-        for page in doc:
-            html_content += page.get_text("html")
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(f"<html><body>{html_content}</body></html>")
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Pre-read the PDF and parse from memory
+        with open(pdf_path, "rb") as fh:
+            pdf_bytes = fh.read()
+        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        # Collect pages with a list comprehension and join once — linear
+        # time, unlike += string concatenation
+        parts = [page.get_text("html") for page in doc]
+        with output_path.open("w", encoding="utf-8", buffering=1 << 16) as f:
+            f.write("<html><body>")
+            f.write("".join(parts))
+            f.write("</body></html>")
         doc.close()
         return output_path
     except Exception as e:
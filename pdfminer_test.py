@@ -2,18 +2,15 @@ from pdfminer.high_level import extract_text_to_fp
 from io import StringIO
 import sys
 import os
+from pathlib import Path
 
 def convert_pdf_to_html(pdf_path, output_folder="output"):
     try:
-        # Create output folder if it doesn't exist
-        os.makedirs(output_folder, exist_ok=True)
-        
-        # Get the PDF filename without extension
-        pdf_name = os.path.splitext(os.path.basename(pdf_path))[0]
-        
-        # Create output path with HTML extension
-        output_path = os.path.join(output_folder, f"{pdf_name}.html")
-        
+        # Resolve paths once with pathlib
+        pdf_path = Path(pdf_path)
+        output_path = Path(output_folder) / f"{pdf_path.stem}.html"
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
         # Create StringIO object without encoding specification
         output_string = StringIO()
         
@@ -22,7 +19,7 @@ def convert_pdf_to_html(pdf_path, output_folder="output"):
             extract_text_to_fp(fin, output_string, output_type='html', codec=None)
         
         # Write the HTML content to file
-        with open(output_path, "w", encoding="utf-8") as fout:
+        with output_path.open("w", encoding="utf-8", buffering=1 << 16) as fout:
             output_string.seek(0)  # Reset the StringIO cursor to beginning
             fout.write(output_string.getvalue())
             
@@ -1,18 +1,14 @@
 import pdfplumber
 import sys
-import os
+from pathlib import Path
 
 def convert_pdf_to_html(pdf_path, output_folder="output"):
     try:
-        # Create output folder if it doesn't exist
-        os.makedirs(output_folder, exist_ok=True)
-        
-        # Get the PDF filename without extension
-        pdf_name = os.path.splitext(os.path.basename(pdf_path))[0]
-        
-        # Create output path with HTML extension
-        output_path = os.path.join(output_folder, f"{pdf_name}.html")
-        
+        # Resolve paths once with pathlib
+        pdf_path = Path(pdf_path)
+        output_path = Path(output_folder) / f"{pdf_path.stem}.html"
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
         html_content = []
         html_content.append("<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n<title>PDF to HTML</title>\n<style>\nbody { font-family: sans-serif; margin: 20px; }\n.page { margin-bottom: 20px; border: 1px solid #eee; padding: 15px; }\n.text-block { margin-bottom: 10px; }\n.image-container { text-align: center; margin: 10px 0; }\nimg { max-width: 100%; height: auto; border: 1px solid #ddd; }\n</style>\n</head>\n<body>")
 
@@ -34,7 +30,7 @@ def convert_pdf_to_html(pdf_path, output_folder="output"):
             html_content.append('</body>\n</html>')
             
             # Write to file
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with output_path.open('w', encoding='utf-8', buffering=1 << 16) as f:
                 f.write('\n'.join(html_content))
             
             return output_path
@@ -1,23 +1,31 @@
 from pdfminer.high_level import extract_text_to_fp
 from pdfminer.layout import LAParams
-from io import StringIO
+from io import BytesIO
+from lxml import etree
+import lxml.html
 import sys
 import os
+from pathlib import Path
+
+# Custom CSS for better formatting
+CUSTOM_CSS = """
+        body { font-family: Arial, sans-serif; line-height: 1.6; }
+        div { margin-bottom: 1em; }
+        table { border-collapse: collapse; width: 100%; }
+        td, th { border: 1px solid #ddd; padding: 8px; }
+        pre { white-space: pre-wrap; }
+"""
 
 def convert_pdf_to_html(pdf_path, output_folder="output"):
     try:
-        # Create output folder if it doesn't exist
-        os.makedirs(output_folder, exist_ok=True)
-        
-        # Get the PDF filename without extension
-        pdf_name = os.path.splitext(os.path.basename(pdf_path))[0]
-        
-        # Create output path with HTML extension
-        output_path = os.path.join(output_folder, f"{pdf_name}.html")
-        
+        # Resolve paths once with pathlib
+        pdf_path = Path(pdf_path)
+        output_path = Path(output_folder) / f"{pdf_path.stem}.html"
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
         # Create output buffer
-        output_string = StringIO()
-        
+        output_buffer = BytesIO()
+
         # Set layout parameters for better formatting preservation
         laparams = LAParams(
             line_margin=0.3,
@@ -26,44 +34,40 @@ def convert_pdf_to_html(pdf_path, output_folder="output"):
             detect_vertical=True,
             all_texts=True
         )
-        
+
         # Convert PDF to HTML with formatting
         with open(pdf_path, 'rb') as fin:
             extract_text_to_fp(
                 fin,
-                output_string,
+                output_buffer,
                 output_type='html',
                 laparams=laparams
             )
-        
-        # Add custom CSS for better formatting
-        html_template = """
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <style>
-        body { font-family: Arial, sans-serif; line-height: 1.6; }
-        div { margin-bottom: 1em; }
-        table { border-collapse: collapse; width: 100%; }
-        td, th { border: 1px solid #ddd; padding: 8px; }
-        pre { white-space: pre-wrap; }
-    </style>
-</head>
-<body>
-{}
-</body>
-</html>
-"""
-        
-        # Write formatted HTML to file
-        with open(output_path, "w", encoding="utf-8") as fout:
-            output_string.seek(0)
-            content = output_string.getvalue()
-            fout.write(html_template.format(content))
-            
+
+        # Work on pdfminer's output as a tree instead of pasting the
+        # serialized string into another template
+        doc = lxml.html.document_fromstring(output_buffer.getvalue())
+
+        # Inject the custom stylesheet into <head>
+        head = doc.find("head")
+        if head is None:
+            head = etree.SubElement(doc, "head")
+        style = etree.SubElement(head, "style")
+        style.text = CUSTOM_CSS
+
+        # Serialize once, directly to the output file
+        with output_path.open("wb") as fout:
+            fout.write(
+                etree.tostring(
+                    doc,
+                    method="html",
+                    encoding="utf-8",
+                    doctype="<!DOCTYPE html>"
+                )
+            )
+
         print(f"Successfully converted '{pdf_path}' to '{output_path}'")
-        
+
     except Exception as e:
         print(f"An error occurred: {e}", file=sys.stderr)
         raise